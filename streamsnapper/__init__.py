@@ -4,7 +4,7 @@ from typing import List
 # Local imports
 from .exceptions import EmptyDataError, FFmpegNotFoundError, InvalidDataError, MergeError, ScrapingError, StreamSnapperError
 from .merger import Merger
-from .youtube import YouTube, YouTubeExtractor
+from .youtube import YouTube, YouTubeExtractor, clear_cache
 
 
 __all__: List[str] = [
@@ -17,4 +17,5 @@ __all__: List[str] = [
     "Merger",
     "YouTube",
     "YouTubeExtractor",
+    "clear_cache",
 ]
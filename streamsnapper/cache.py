@@ -0,0 +1,103 @@
+# Built-in imports
+from hashlib import sha256
+from json import JSONDecodeError, dumps, loads
+from os import PathLike
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from time import time
+from typing import Any, Optional, Union
+
+
+class Cache:
+    """A class for storing JSON-serializable data on disk, with an expiration time for each entry."""
+
+    def __init__(self, directory: Union[str, PathLike], expire: Optional[int] = 3600) -> None:
+        """
+        Initialize the Cache class with the directory where the entries will be stored.
+
+        Args:
+            directory: The directory to store the cache entries in. It will be created if it does not exist. (required)
+            expire: The time in seconds after which an entry is considered expired. If None, entries never expire. (default: 3600)
+        """
+
+        self._directory = Path(directory).resolve()
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._expire = expire
+
+    def _get_entry_path(self, key: str) -> Path:
+        """
+        Get the path of the file that stores the entry for a given key.
+
+        Args:
+            key: The key of the entry. (required)
+
+        Returns:
+            The path of the entry file.
+        """
+
+        return Path(self._directory, f"{sha256(key.encode('utf-8')).hexdigest()}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get the value stored for a given key.
+
+        Args:
+            key: The key of the entry. (required)
+
+        Returns:
+            The stored value, or None if the entry does not exist, is expired or is unreadable.
+        """
+
+        entry_path = self._get_entry_path(key)
+
+        try:
+            if self._expire is not None and time() - entry_path.stat().st_mtime > self._expire:
+                entry_path.unlink(missing_ok=True)
+
+                return None
+
+            return loads(entry_path.read_text(encoding="utf-8"))
+        except (OSError, JSONDecodeError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value for a given key, replacing any previous entry.
+
+        - The value is written to a temporary file unique to this write and then moved into place, so concurrent writes of the same key never share a temporary file or leave a partially written entry.
+        - Caching is best-effort: if the entry cannot be written or the value is not JSON-serializable, it is skipped instead of raising an error.
+
+        Args:
+            key: The key of the entry. (required)
+            value: The JSON-serializable value to store. (required)
+        """
+
+        entry_path = self._get_entry_path(key)
+        tmp_entry_path: Optional[Path] = None
+        is_replaced = False
+
+        try:
+            with NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self._directory, prefix=f".{entry_path.name}.", suffix=".tmp", delete=False
+            ) as tmp_entry_file:
+                tmp_entry_path = Path(tmp_entry_file.name)
+                tmp_entry_file.write(dumps(value))
+
+            tmp_entry_path.replace(entry_path)
+            is_replaced = True
+        except (OSError, TypeError, ValueError):
+            pass
+        finally:
+            if tmp_entry_path is not None and not is_replaced:
+                try:
+                    tmp_entry_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+
+        for entry_path in self._directory.glob("*.json"):
+            entry_path.unlink(missing_ok=True)
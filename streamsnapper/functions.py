@@ -1,7 +1,13 @@
 # Built-in imports
-from re import sub as re_sub
+from re import compile as re_compile
+from string import ascii_letters, digits
 from typing import Any, Callable, Dict, List, Optional, Union
 from unicodedata import normalize
+from urllib.parse import unquote
+
+
+_UNSUPPORTED_ASCII_BYTES = bytes(code for code in range(128) if chr(code) not in ascii_letters + digits + "-_()[]{}!$#+;,. ")
+_WHITESPACE_RE = re_compile(r"\s+")
 
 
 def get_value(
@@ -48,26 +54,32 @@ def get_value(
     if value is None:
         return default_to
 
-    if convert_to is not None:
-        converters = [convert_to] if not isinstance(convert_to, list) else convert_to
+    if convert_to is None:
+        return value
 
-        for converter in converters:
-            try:
-                value = converter(value)
-                break
-            except (ValueError, TypeError):
-                if converter == converters[-1]:
-                    return default_to
+    if callable(convert_to):
+        try:
+            return convert_to(value)
+        except (ValueError, TypeError):
+            return default_to
 
-                continue
+    for converter in convert_to:
+        try:
+            return converter(value)
+        except (ValueError, TypeError):
+            continue
 
-    return value
+    return default_to if convert_to else value
 
 
-def format_string(query: str, max_length: Optional[int] = None) -> Optional[str]:
+def format_string(query: Optional[str], max_length: Optional[int] = None) -> Optional[str]:
     """
     Sanitizes a given string by removing all non-ASCII characters and non-alphanumeric characters, and trims it to a given maximum length.
 
+    - If the string is None or empty, the function returns None right away, without running any normalization or substitution.
+    - If the string is already ASCII, the Unicode normalization step is skipped, as it would leave the string unchanged.
+    - Unsupported characters are deleted with a single bytes.translate() pass over the ASCII-encoded string.
+
     Args:
         query: The string to sanitize. (required)
         max_length: The maximum length to trim the sanitized string to. (default: None)
@@ -79,12 +91,17 @@ def format_string(query: str, max_length: Optional[int] = None) -> Optional[str]
     if not query:
         return None
 
-    normalized_string = normalize("NFKD", query).encode("ASCII", "ignore").decode("utf-8")
-    sanitized_string = re_sub(r"\s+", " ", re_sub(r"[^a-zA-Z0-9\-_()[\]{}!$#+;,. ]", "", normalized_string)).strip()
+    if query.isascii():
+        ascii_bytes = query.encode("ascii")
+    else:
+        ascii_bytes = normalize("NFKD", query).encode("ascii", "ignore")
+
+    filtered_string = ascii_bytes.translate(None, _UNSUPPORTED_ASCII_BYTES).decode("ascii")
+    sanitized_string = _WHITESPACE_RE.sub(" ", filtered_string).strip()
 
     if max_length is not None and len(sanitized_string) > max_length:
-        cutoff = sanitized_string[:max_length].rfind(" ")
-        sanitized_string = sanitized_string[:cutoff] if cutoff != -1 else sanitized_string[:max_length]
+        cutoff = sanitized_string.rfind(" ", 0, max_length)
+        sanitized_string = sanitized_string[: cutoff if cutoff != -1 else max_length]
 
     return sanitized_string if sanitized_string else None
 
@@ -101,3 +118,22 @@ def strip(string: Any) -> str:
     """
 
     return str(string).strip()
+
+
+def unquote_url(url: Optional[str]) -> Optional[str]:
+    """
+    Decodes percent-encoded characters in a given URL and strips leading and trailing whitespace from it.
+
+    - If the URL has no percent-encoded characters, the decoding step is skipped.
+
+    Args:
+        url: The URL to decode. (required)
+
+    Returns:
+        The decoded URL, or None if no URL is provided.
+    """
+
+    if not url:
+        return None
+
+    return unquote(url).strip() if "%" in url else url.strip()
@@ -61,6 +61,7 @@ class Merger:
 
         stdout = None if self._logging else DEVNULL
         stderr = None if self._logging else DEVNULL
+        quiet_args = [] if self._logging else ["-loglevel", "error", "-nostats"]
 
         try:
             run(
@@ -68,6 +69,7 @@ class Merger:
                     ffmpeg_path.as_posix(),
                     "-y",
                     "-hide_banner",
+                    *quiet_args,
                     "-i",
                     video_path.as_posix(),
                     "-i",
@@ -1,36 +1,316 @@
 # Built-in imports
+from atexit import register as register_exit_handler
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from json import JSONDecodeError
 from locale import getlocale
-from os import PathLike
+from operator import itemgetter
+from os import PathLike, getenv
 from pathlib import Path
+from random import random
 from re import compile as re_compile
 from shutil import rmtree
+from string import ascii_letters, digits
 from tempfile import gettempdir
-from typing import Any, Dict, List, Literal, Optional, Type, Union
-from urllib.parse import unquote
-
-# Third-party imports
-from httpx import get, head
-from scrapetube import (
-    get_search as scrape_youtube_search,
-    get_playlist as scrape_youtube_playlist,
-    get_channel as scrape_youtube_channel,
-)
-from turbodl import TurboDL
-from yt_dlp import YoutubeDL
-from yt_dlp import utils as yt_dlp_utils
+from threading import Semaphore, local
+from time import sleep
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterator, List, Literal, Optional, Tuple, Type, Union
 
 # Local imports
+from .cache import Cache
 from .exceptions import EmptyDataError, InvalidDataError, ScrapingError
-from .functions import format_string, get_value, strip
+from .functions import format_string, get_value, unquote_url
 from .merger import Merger
 
 
+if TYPE_CHECKING:
+    from httpx import Client
+    from yt_dlp import YoutubeDL
+
+
+_PLATFORM_RE = re_compile(r"(?:https?://)?(?:www\.)?(music\.)?youtube\.com|youtu\.be|youtube\.com/shorts")
+_VIDEO_ID_RE = re_compile(r"(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/|shorts/|music/|live/|.*[?&]v=))([a-zA-Z0-9_-]{11})")
+_PLAYLIST_ID_RE = re_compile(
+    r"(?:youtube\.com/(?:playlist\?list=|watch\?.*?&list=|music/playlist\?list=|music\.youtube\.com/watch\?.*?&list=))([a-zA-Z0-9_-]+)"
+)
+_VIDEO_ID_CHARACTERS = frozenset(ascii_letters + digits + "_-")
+_VIDEO_ID_URL_PREFIXES = (
+    "youtube.com/watch?v=",
+    "youtu.be/",
+    "youtube.com/shorts/",
+    "youtube.com/embed/",
+    "youtube.com/live/",
+    "youtube.com/v/",
+)
+
+_SCRAPE_SEMAPHORE = Semaphore(2)
+
+_THUMBNAIL_NAMES = ("maxresdefault", "sddefault", "hqdefault", "mqdefault", "default")
+_THUMBNAIL_PROBE_BATCH_SIZE = 3  # hqdefault, the third name, exists for virtually every video
+
+_VIDEO_FORMAT_EXTENSIONS: Dict[int, str] = {
+    702: "mp4",  # AV1 HFR High - MP4 - 7680x4320
+    402: "mp4",  # AV1 HFR - MP4 - 7680x4320
+    571: "mp4",  # AV1 HFR - MP4 - 7680x4320
+    272: "webm",  # VP9 HFR - WEBM - 7680x4320
+    701: "mp4",  # AV1 HFR High - MP4 - 3840x2160
+    401: "mp4",  # AV1 HFR - MP4 - 3840x2160
+    337: "webm",  # VP9.2 HDR HFR - WEBM - 3840x2160
+    315: "webm",  # VP9 HFR - WEBM - 3840x2160
+    313: "webm",  # VP9 - WEBM - 3840x2160
+    305: "mp4",  # H.264 HFR - MP4 - 3840x2160
+    266: "mp4",  # H.264 - MP4 - 3840x2160
+    700: "mp4",  # AV1 HFR High - MP4 - 2560x1440
+    400: "mp4",  # AV1 HFR - MP4 - 2560x1440
+    336: "webm",  # VP9.2 HDR HFR - WEBM - 2560x1440
+    308: "webm",  # VP9 HFR - WEBM - 2560x1440
+    271: "webm",  # VP9 - WEBM - 2560x1440
+    304: "mp4",  # H.264 HFR - MP4 - 2560x1440
+    264: "mp4",  # H.264 - MP4 - 2560x1440
+    699: "mp4",  # AV1 HFR High - MP4 - 1920x1080
+    399: "mp4",  # AV1 HFR - MP4 - 1920x1080
+    335: "webm",  # VP9.2 HDR HFR - WEBM - 1920x1080
+    303: "webm",  # VP9 HFR - WEBM - 1920x1080
+    248: "webm",  # VP9 - WEBM - 1920x1080
+    # 616: 'webm',  # VP9 - WEBM - 1920x1080 - YouTube Premium Format (M3U8)
+    299: "mp4",  # H.264 HFR - MP4 - 1920x1080
+    137: "mp4",  # H.264 - MP4 - 1920x1080
+    216: "mp4",  # H.264 - MP4 - 1920x1080
+    170: "webm",  # VP8 - WEBM - 1920x1080
+    698: "mp4",  # AV1 HFR High - MP4 - 1280x720
+    398: "mp4",  # AV1 HFR - MP4 - 1280x720
+    334: "webm",  # VP9.2 HDR HFR - WEBM - 1280x720
+    302: "webm",  # VP9 HFR - WEBM - 1280x720
+    612: "webm",  # VP9 HFR - WEBM - 1280x720
+    247: "webm",  # VP9 - WEBM - 1280x720
+    298: "mp4",  # H.264 HFR - MP4 - 1280x720
+    136: "mp4",  # H.264 - MP4 - 1280x720
+    169: "webm",  # VP8 - WEBM - 1280x720
+    697: "mp4",  # AV1 HFR High - MP4 - 854x480
+    397: "mp4",  # AV1 - MP4 - 854x480
+    333: "webm",  # VP9.2 HDR HFR - WEBM - 854x480
+    244: "webm",  # VP9 - WEBM - 854x480
+    135: "mp4",  # H.264 - MP4 - 854x480
+    168: "webm",  # VP8 - WEBM - 854x480
+    696: "mp4",  # AV1 HFR High - MP4 - 640x360
+    396: "mp4",  # AV1 - MP4 - 640x360
+    332: "webm",  # VP9.2 HDR HFR - WEBM - 640x360
+    243: "webm",  # VP9 - WEBM - 640x360
+    134: "mp4",  # H.264 - MP4 - 640x360
+    167: "webm",  # VP8 - WEBM - 640x360
+    695: "mp4",  # AV1 HFR High - MP4 - 426x240
+    395: "mp4",  # AV1 - MP4 - 426x240
+    331: "webm",  # VP9.2 HDR HFR - WEBM - 426x240
+    242: "webm",  # VP9 - WEBM - 426x240
+    133: "mp4",  # H.264 - MP4 - 426x240
+    694: "mp4",  # AV1 HFR High - MP4 - 256x144
+    394: "mp4",  # AV1 - MP4 - 256x144
+    330: "webm",  # VP9.2 HDR HFR - WEBM - 256x144
+    278: "webm",  # VP9 - WEBM - 256x144
+    598: "webm",  # VP9 - WEBM - 256x144
+    160: "mp4",  # H.264 - MP4 - 256x144
+    597: "mp4",  # H.264 - MP4 - 256x144
+}
+_VIDEO_FORMAT_IDS = frozenset(_VIDEO_FORMAT_EXTENSIONS)
+
+_AUDIO_FORMAT_EXTENSIONS: Dict[int, str] = {
+    338: "webm",  # Opus - (VBR) ~480 KBPS - Quadraphonic (4)
+    380: "mp4",  # AC3 - 384 KBPS - Surround (5.1)
+    328: "mp4",  # EAC3 - 384 KBPS - Surround (5.1)
+    325: "mp4",  # DTSE (DTS Express) - 384 KBPS - Surround (5.1)
+    258: "mp4",  # AAC (LC) - 384 KBPS - Surround (5.1)
+    327: "mp4",  # AAC (LC) - 256 KBPS - Surround (5.1)
+    141: "mp4",  # AAC (LC) - 256 KBPS - Stereo (2)
+    774: "webm",  # Opus - (VBR) ~256 KBPS - Stereo (2)
+    256: "mp4",  # AAC (HE v1) - 192 KBPS - Surround (5.1)
+    251: "webm",  # Opus - (VBR) <=160 KBPS - Stereo (2)
+    140: "mp4",  # AAC (LC) - 128 KBPS - Stereo (2)
+    250: "webm",  # Opus - (VBR) ~70 KBPS - Stereo (2)
+    249: "webm",  # Opus - (VBR) ~50 KBPS - Stereo (2)
+    139: "mp4",  # AAC (HE v1) - 48 KBPS - Stereo (2)
+    600: "webm",  # Opus - (VBR) ~35 KBPS - Stereo (2)
+    599: "mp4",  # AAC (HE v1) - 30 KBPS - Stereo (2)
+}
+_AUDIO_FORMAT_IDS = frozenset(_AUDIO_FORMAT_EXTENSIONS)
+
+
+def _parse_format_id(stream: Dict[Any, Any]) -> Optional[int]:
+    """
+    Parse the numeric YouTube format ID of a given stream.
+
+    - Multi-language audio tracks have a numeric suffix (e.g. '251-1') and are parsed to their base format ID.
+    - Any other suffix (e.g. '251-drc') or non-numeric format ID (e.g. 'sb0') is not supported and returns None.
+
+    Args:
+        stream: The stream to parse the format ID from. (required)
+
+    Returns:
+        The parsed format ID, or None if the format ID is missing or not supported.
+    """
+
+    format_id, _, suffix = (stream.get("format_id") or "").partition("-")
+
+    if not format_id.isdigit() or (suffix and not suffix.isdigit()):
+        return None
+
+    return int(format_id)
+
+
+def _score_video_stream(stream: Dict[Any, Any]) -> float:
+    """
+    Calculate a score for a given video stream.
+
+    - The score is a product of the stream's width, height, framerate, and bitrate.
+    - The score is used to sort the streams in order of quality.
+
+    Args:
+        stream: The video stream to calculate the score for. (required)
+
+    Returns:
+        The calculated score for the stream.
+    """
+
+    width = stream.get("width") or 0
+    height = stream.get("height") or 0
+    framerate = stream.get("fps") or 0
+    bitrate = stream.get("tbr") or 0
+
+    return float(width * height * framerate * bitrate)
+
+
+def _extract_video_stream_info(
+    stream: Dict[Any, Any], youtube_format_id: int
+) -> Dict[str, Optional[Union[str, int, float, bool]]]:
+    """
+    Extract the information of a given video stream.
+
+    Args:
+        stream: The video stream to extract the information from. (required)
+        youtube_format_id: The parsed YouTube format ID of the stream. (required)
+
+    Returns:
+        A dictionary containing the extracted information of the stream.
+    """
+
+    codec = stream.get("vcodec")
+    codec_parts = codec.split(".", 1) if codec else []
+    quality_note = stream.get("format_note")
+
+    height = get_value(stream, "height", convert_to=int)
+
+    return {
+        "bitrate": get_value(stream, "tbr", convert_to=float),
+        "codec": codec_parts[0] if codec_parts else None,
+        "codecVariant": codec_parts[1] if len(codec_parts) > 1 else None,
+        "extension": _VIDEO_FORMAT_EXTENSIONS.get(youtube_format_id, "mp4"),
+        "framerate": get_value(stream, "fps", convert_to=float),
+        "height": height,
+        "isHDR": "hdr" in quality_note.lower() if quality_note else False,
+        "language": stream.get("language"),
+        "quality": height,
+        "qualityNote": quality_note,
+        "rawCodec": codec,
+        "size": get_value(stream, "filesize", convert_to=int),
+        "url": unquote_url(stream.get("url")),
+        "width": get_value(stream, "width", convert_to=int),
+        "youtubeFormatId": youtube_format_id,
+    }
+
+
+def _score_audio_stream(stream: Dict[Any, Any]) -> float:
+    """
+    Calculate a score for a given audio stream.
+
+    - The score is a product of the stream's bitrate and sample rate.
+    - The score is used to sort the streams in order of quality.
+
+    Args:
+        stream: The audio stream to calculate the score for. (required)
+
+    Returns:
+        The calculated score for the stream.
+    """
+
+    bitrate = stream.get("abr") or 0
+    sample_rate = stream.get("asr") or 0
+
+    bitrate_priority = 0.1  # The lower the value, the higher the priority of bitrate over samplerate
+
+    return float((bitrate * bitrate_priority) + (sample_rate / 1000))
+
+
+def _extract_audio_stream_info(
+    stream: Dict[Any, Any], youtube_format_id: int
+) -> Dict[str, Optional[Union[str, int, float, bool]]]:
+    """
+    Extract the information of a given audio stream.
+
+    Args:
+        stream: The audio stream to extract the information from. (required)
+        youtube_format_id: The parsed YouTube format ID of the stream. (required)
+
+    Returns:
+        A dictionary containing the extracted information of the stream.
+    """
+
+    codec = stream.get("acodec")
+    codec_parts = codec.split(".", 1) if codec else []
+    youtube_format_note = stream.get("format_note")
+
+    return {
+        "bitrate": get_value(stream, "abr", convert_to=float),
+        "channels": get_value(stream, "audio_channels", convert_to=int),
+        "codec": codec_parts[0] if codec_parts else None,
+        "codecVariant": codec_parts[1] if len(codec_parts) > 1 else None,
+        "extension": _AUDIO_FORMAT_EXTENSIONS.get(youtube_format_id, "mp3"),
+        "isOriginalAudio": "(default)" in youtube_format_note or youtube_format_note.islower() if youtube_format_note else None,
+        "language": stream.get("language"),
+        "qualityNote": youtube_format_note,
+        "rawCodec": codec,
+        "samplerate": get_value(stream, "asr", convert_to=int),
+        "size": get_value(stream, "filesize", convert_to=int),
+        "url": unquote_url(stream.get("url")),
+        "youtubeFormatId": youtube_format_id,
+    }
+
+
 class InformationStructure:
     """
     A class for storing information about a YouTube video.
     """
 
+    __slots__ = (
+        "_sourceUrl",
+        "_shortUrl",
+        "_embedUrl",
+        "_youtubeMusicUrl",
+        "_fullUrl",
+        "_id",
+        "_title",
+        "_cleanTitle",
+        "_description",
+        "_channelId",
+        "_channelUrl",
+        "_channelName",
+        "_cleanChannelName",
+        "_isVerifiedChannel",
+        "_duration",
+        "_viewCount",
+        "_isAgeRestricted",
+        "_categories",
+        "_tags",
+        "_isStreaming",
+        "_uploadTimestamp",
+        "_availability",
+        "_chapters",
+        "_commentCount",
+        "_likeCount",
+        "_dislikeCount",
+        "_followCount",
+        "_language",
+        "_thumbnails",
+    )
+
     def __init__(self) -> None:
         """
         Initialize the Information class.
@@ -74,7 +354,7 @@ class InformationStructure:
             A dictionary containing the information, alphabetically ordered.
         """
 
-        return dict(sorted({key[1:]: value for key, value in self.__dict__.items()}.items()))
+        return {key: getattr(self, slot) for key, slot in _INFORMATION_FIELDS}
 
     @property
     def sourceUrl(self) -> Optional[str]:
@@ -85,7 +365,7 @@ class InformationStructure:
             The source URL of the video.
         """
 
-        return self._source_url
+        return self._sourceUrl
 
     @property
     def shortUrl(self) -> Optional[str]:
@@ -96,7 +376,7 @@ class InformationStructure:
             The short URL of the video.
         """
 
-        return self._short_url
+        return self._shortUrl
 
     @property
     def embedUrl(self) -> Optional[str]:
@@ -396,481 +676,854 @@ class InformationStructure:
         return self._thumbnails
 
 
-class YouTube:
-    """
-    A class for extracting and formatting data from YouTube videos, facilitating access to general video information, video streams, audio streams and subtitles.
+_INFORMATION_FIELDS = tuple(sorted((slot[1:], slot) for slot in InformationStructure.__slots__))
+
+
+@lru_cache(maxsize=1)
+def _get_http_client() -> "Client":
     """
+    Get the pooled HTTP client shared by the dislike count and thumbnail requests.
 
-    def __init__(self, logging: bool = False) -> None:
-        """
-        Initialize the YouTube class with the required settings for extracting and formatting data from YouTube videos (raw data provided by yt-dlp library).
+    - The client is created on first use, so importing the package does not import httpx, and it is closed at interpreter exit.
 
-        Args:
-            logging: Enable or disable logging for the YouTube class. Defaults to False. (default: False)
-        """
+    Returns:
+        The shared httpx client.
+    """
 
-        logging = not logging
+    from httpx import Client, Limits
 
-        self._ydl_opts: Dict[str, bool] = {
-            "extract_flat": True,
-            "geo_bypass": True,
-            "noplaylist": True,
-            "age_limit": None,
-            "quiet": logging,
-            "no_warnings": logging,
-            "ignoreerrors": logging,
-        }
-        self._extractor: Type[YouTubeExtractor] = YouTubeExtractor()
-        self._raw_youtube_data: Dict[Any, Any] = {}
-        self._raw_youtube_streams: List[Dict[Any, Any]] = []
-        self._raw_youtube_subtitles: Dict[str, List[Dict[str, str]]] = {}
+    http_client = Client(
+        headers={
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+        },
+        limits=Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=5.0,
+    )
+    register_exit_handler(http_client.close)
 
-        found_system_language = getlocale()[0]
+    return http_client
 
-        if found_system_language:
-            try:
-                self.base_system_language: str = found_system_language.split("_")[0].lower()
-                self.system_language_suffix: str = found_system_language.split("_")[1].upper()
-            except IndexError:
-                self.base_system_language: str = "en"
-                self.system_language_suffix: str = "US"
-        else:
-            self.base_system_language: str = "en"
-            self.system_language_suffix: str = "US"
 
-        self.information: Type[InformationStructure] = InformationStructure()
+def _create_shared_cache(name: str, expire: int) -> Optional[Cache]:
+    """
+    Create one of the shared caches stored in the user cache directory (~/.cache/streamsnapper).
 
-        self.best_video_streams: List[Dict[str, Any]] = []
-        self.best_video_stream: Dict[str, Any] = {}
-        self.best_video_download_url: Optional[str] = None
+    - The shared caches are only used when the STREAMSNAPPER_CACHE environment variable is set to 1.
+    - If the home directory cannot be resolved or the cache directory cannot be created, the shared cache is disabled.
 
-        self.best_audio_streams: List[Dict[str, Any]] = []
-        self.best_audio_stream: Dict[str, Any] = {}
-        self.best_audio_download_url: Optional[str] = None
+    Args:
+        name: The name of the subdirectory to store the cache entries in. (required)
+        expire: The time in seconds after which an entry is considered expired. (required)
 
-        self.subtitle_streams: Dict[str, List[Dict[str, str]]] = {}
+    Returns:
+        The shared cache, or None if it is disabled.
+    """
 
-        self.available_video_qualities: List[str] = []
-        self.available_audio_languages: List[str] = []
+    if getenv("STREAMSNAPPER_CACHE", "0") != "1":
+        return None
 
-    def extract(self, url: Optional[str] = None, ytdlp_data: Optional[Dict[Any, Any]] = None) -> None:
-        """
-        Extract the YouTube video data from a URL or provided previously extracted yt-dlp data.
+    try:
+        return Cache(Path(Path.home(), ".cache", "streamsnapper", name), expire=expire)
+    except (RuntimeError, OSError):
+        return None
 
-        - If a URL is provided, it will be used to scrape the YouTube video data.
-        - If yt-dlp data is provided, it will be used directly.
-        - If both URL and yt-dlp data are provided, the yt-dlp data will be used.
 
-        Args:
-            url: The YouTube video URL to extract data from. (default: None)
-            ytdlp_data: The previously extracted yt-dlp data. (default: None)
+@lru_cache(maxsize=1)
+def _get_dislike_count_cache() -> Optional[Cache]:
+    """
+    Get the shared cache of dislike counts, creating it on first use.
 
-        Raises:
-            ValueError: If no URL or yt-dlp data is provided.
-            InvalidDataError: If the provided yt-dlp data is invalid.
-            ScrapingError: If an error occurs while scraping the YouTube video.
-        """
+    Returns:
+        The shared cache of dislike counts, or None if it is disabled.
+    """
 
-        self._source_url = url
+    return _create_shared_cache("dislikes", expire=3600)
 
-        if ytdlp_data:
-            self._raw_youtube_data = ytdlp_data
-        elif not url:
-            raise ValueError("No YouTube video URL or yt-dlp data provided")
-        else:
-            video_id = self._extractor.extract_video_id(url)
 
-            if not video_id:
-                raise ValueError(f'Invalid YouTube video URL: "{url}"')
+@lru_cache(maxsize=1)
+def _get_video_listing_cache() -> Optional[Cache]:
+    """
+    Get the shared cache of playlist and channel video listings, creating it on first use.
 
-            try:
-                with YoutubeDL(self._ydl_opts) as ydl:
-                    self._raw_youtube_data = ydl.extract_info(url=url, download=False, process=True)
-            except (yt_dlp_utils.DownloadError, yt_dlp_utils.ExtractorError, Exception) as e:
-                raise ScrapingError(f'Error occurred while scraping YouTube video: "{url}"') from e
+    Returns:
+        The shared cache of video listings, or None if it is disabled.
+    """
 
-        self._raw_youtube_streams = get_value(self._raw_youtube_data, "formats", convert_to=list)
-        self._raw_youtube_subtitles = get_value(self._raw_youtube_data, "subtitles", convert_to=dict, default_to={})
+    return _create_shared_cache("listings", expire=86400)
 
-        if self._raw_youtube_streams is None:
-            raise InvalidDataError('Invalid yt-dlp data. Missing required keys: "formats"')
 
-    def analyze_information(self, check_thumbnails: bool = False, retrieve_dislike_count: bool = False) -> None:
-        """
-        Analyze the information of the YouTube video.
+def _fetch_dislike_count(video_id: str) -> Optional[int]:
+    """
+    Fetch the dislike count of a YouTube video from the Return YouTube Dislike API.
 
-        Args:
-            check_thumbnails: Check if all video thumbnails are available. (default: False)
-            retrieve_dislike_count: Retrieve the dislike count from the returnyoutubedislike.com API. (default: False)
+    - If the shared cache is enabled, a cached count is returned without any request, and a fetched count is stored in it.
 
-        Raises:
-            InvalidDataError: If the provided yt-dlp data is invalid.
-        """
+    Args:
+        video_id: The ID of the YouTube video. (required)
 
-        data = self._raw_youtube_data
+    Returns:
+        The dislike count of the video, or None if it could not be retrieved.
+    """
 
-        id_ = get_value(data, "id")
-        title = get_value(data, "fulltitle", ["title"])
-        clean_title = format_string(title)
-        description = get_value(data, "description")
-        channel_name = get_value(data, "channel", ["uploader"])
-        clean_channel_name = format_string(channel_name)
-        chapters = [
-            {
-                "title": get_value(chapter, "title"),
-                "startTime": get_value(chapter, "start_time", convert_to=float),
-                "endTime": get_value(chapter, "end_time", convert_to=float),
-            }
-            for chapter in get_value(data, "chapters", convert_to=list, default_to=[])
-        ]
+    dislike_count_cache = _get_dislike_count_cache()
+    dislike_count = dislike_count_cache.get(video_id) if dislike_count_cache else None
 
-        dislike_count = None
+    if dislike_count is not None:
+        return dislike_count
 
-        if retrieve_dislike_count:
-            r = get(
-                "https://returnyoutubedislikeapi.com/votes",
-                params={"videoId": id_},
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-                },
-            )
+    r = _get_http_client().get("https://returnyoutubedislikeapi.com/votes", params={"videoId": video_id})
 
-            if r.is_success:
-                try:
-                    dislike_count = get_value(r.json(), "dislikes", convert_to=int)
-                except JSONDecodeError:
-                    pass
-
-        self.information._sourceUrl = self._source_url
-        self.information._shortUrl = f"https://youtu.be/{id_}"
-        self.information._embedUrl = f"https://www.youtube.com/embed/{id_}"
-        self.information._youtubeMusicUrl = f"https://music.youtube.com/watch?v={id_}"
-        self.information._fullUrl = f"https://www.youtube.com/watch?v={id_}"
-        self.information._id = id_
-        self.information._title = title
-        self.information._cleanTitle = clean_title
-        self.information._description = description if description else None
-        self.information._channelId = get_value(data, "channel_id")
-        self.information._channelUrl = get_value(data, "channel_url", ["uploader_url"])
-        self.information._channelName = channel_name
-        self.information._cleanChannelName = clean_channel_name
-        self.information._isVerifiedChannel = get_value(data, "channel_is_verified", default_to=False)
-        self.information._duration = get_value(data, "duration")
-        self.information._viewCount = get_value(data, "view_count")
-        self.information._isAgeRestricted = get_value(data, "age_limit", convert_to=bool)
-        self.information._categories = get_value(data, "categories", default_to=[])
-        self.information._tags = get_value(data, "tags", default_to=[])
-        self.information._isStreaming = get_value(data, "is_live")
-        self.information._uploadTimestamp = get_value(data, "timestamp", ["release_timestamp"])
-        self.information._availability = get_value(data, "availability")
-        self.information._chapters = chapters
-        self.information._commentCount = get_value(data, "comment_count", convert_to=int, default_to=0)
-        self.information._likeCount = get_value(data, "like_count", convert_to=int)
-        self.information._dislikeCount = dislike_count
-        self.information._followCount = get_value(data, "channel_follower_count", convert_to=int)
-        self.information._language = get_value(data, "language")
-        self.information._thumbnails = [
-            f"https://img.youtube.com/vi/{id_}/maxresdefault.jpg",
-            f"https://img.youtube.com/vi/{id_}/sddefault.jpg",
-            f"https://img.youtube.com/vi/{id_}/hqdefault.jpg",
-            f"https://img.youtube.com/vi/{id_}/mqdefault.jpg",
-            f"https://img.youtube.com/vi/{id_}/default.jpg",
-        ]
+    if r.is_success:
+        try:
+            dislike_count = get_value(r.json(), "dislikes", convert_to=int)
+        except JSONDecodeError:
+            pass
 
-        if check_thumbnails:
-            while self.information._thumbnails:
-                if head(
-                    self.information._thumbnails[0],
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-                    },
-                    follow_redirects=False,
-                ).is_success:
-                    break
-                else:
-                    self.information._thumbnails.pop(0)
+    if dislike_count is not None and dislike_count_cache:
+        dislike_count_cache.set(video_id, dislike_count)
 
-    def analyze_video_streams(
-        self,
-        preferred_quality: Literal["144p", "240p", "360p", "480p", "720p", "1080p", "1440p", "2160p", "4320p", "all"] = "all",
-    ) -> None:
-        """
-        Analyze the video streams of the YouTube video and select the best stream based on the preferred quality.
+    return dislike_count
 
-        Args:
-            preferred_quality: The preferred quality of the video stream. If a specific quality is provided, the stream will be selected according to the chosen quality, however if the quality is not available, the best quality will be selected. If 'all', all streams will be considered and sorted by quality. (default: 'all')
-        """
 
-        data = self._raw_youtube_streams
+def _get_system_language() -> Tuple[str, str]:
+    """
+    Get the base language and the country suffix of the system locale, falling back to English (US).
 
-        format_id_extension_map = {
-            702: "mp4",  # AV1 HFR High - MP4 - 7680x4320
-            402: "mp4",  # AV1 HFR - MP4 - 7680x4320
-            571: "mp4",  # AV1 HFR - MP4 - 7680x4320
-            272: "webm",  # VP9 HFR - WEBM - 7680x4320
-            701: "mp4",  # AV1 HFR High - MP4 - 3840x2160
-            401: "mp4",  # AV1 HFR - MP4 - 3840x2160
-            337: "webm",  # VP9.2 HDR HFR - WEBM - 3840x2160
-            315: "webm",  # VP9 HFR - WEBM - 3840x2160
-            313: "webm",  # VP9 - WEBM - 3840x2160
-            305: "mp4",  # H.264 HFR - MP4 - 3840x2160
-            266: "mp4",  # H.264 - MP4 - 3840x2160
-            700: "mp4",  # AV1 HFR High - MP4 - 2560x1440
-            400: "mp4",  # AV1 HFR - MP4 - 2560x1440
-            336: "webm",  # VP9.2 HDR HFR - WEBM - 2560x1440
-            308: "webm",  # VP9 HFR - WEBM - 2560x1440
-            271: "webm",  # VP9 - WEBM - 2560x1440
-            304: "mp4",  # H.264 HFR - MP4 - 2560x1440
-            264: "mp4",  # H.264 - MP4 - 2560x1440
-            699: "mp4",  # AV1 HFR High - MP4 - 1920x1080
-            399: "mp4",  # AV1 HFR - MP4 - 1920x1080
-            335: "webm",  # VP9.2 HDR HFR - WEBM - 1920x1080
-            303: "webm",  # VP9 HFR - WEBM - 1920x1080
-            248: "webm",  # VP9 - WEBM - 1920x1080
-            # 616: 'webm',  # VP9 - WEBM - 1920x1080 - YouTube Premium Format (M3U8)
-            299: "mp4",  # H.264 HFR - MP4 - 1920x1080
-            137: "mp4",  # H.264 - MP4 - 1920x1080
-            216: "mp4",  # H.264 - MP4 - 1920x1080
-            170: "webm",  # VP8 - WEBM - 1920x1080
-            698: "mp4",  # AV1 HFR High - MP4 - 1280x720
-            398: "mp4",  # AV1 HFR - MP4 - 1280x720
-            334: "webm",  # VP9.2 HDR HFR - WEBM - 1280x720
-            302: "webm",  # VP9 HFR - WEBM - 1280x720
-            612: "webm",  # VP9 HFR - WEBM - 1280x720
-            247: "webm",  # VP9 - WEBM - 1280x720
-            298: "mp4",  # H.264 HFR - MP4 - 1280x720
-            136: "mp4",  # H.264 - MP4 - 1280x720
-            169: "webm",  # VP8 - WEBM - 1280x720
-            697: "mp4",  # AV1 HFR High - MP4 - 854x480
-            397: "mp4",  # AV1 - MP4 - 854x480
-            333: "webm",  # VP9.2 HDR HFR - WEBM - 854x480
-            244: "webm",  # VP9 - WEBM - 854x480
-            135: "mp4",  # H.264 - MP4 - 854x480
-            168: "webm",  # VP8 - WEBM - 854x480
-            696: "mp4",  # AV1 HFR High - MP4 - 640x360
-            396: "mp4",  # AV1 - MP4 - 640x360
-            332: "webm",  # VP9.2 HDR HFR - WEBM - 640x360
-            243: "webm",  # VP9 - WEBM - 640x360
-            134: "mp4",  # H.264 - MP4 - 640x360
-            167: "webm",  # VP8 - WEBM - 640x360
-            695: "mp4",  # AV1 HFR High - MP4 - 426x240
-            395: "mp4",  # AV1 - MP4 - 426x240
-            331: "webm",  # VP9.2 HDR HFR - WEBM - 426x240
-            242: "webm",  # VP9 - WEBM - 426x240
-            133: "mp4",  # H.264 - MP4 - 426x240
-            694: "mp4",  # AV1 HFR High - MP4 - 256x144
-            394: "mp4",  # AV1 - MP4 - 256x144
-            330: "webm",  # VP9.2 HDR HFR - WEBM - 256x144
-            278: "webm",  # VP9 - WEBM - 256x144
-            598: "webm",  # VP9 - WEBM - 256x144
-            160: "mp4",  # H.264 - MP4 - 256x144
-            597: "mp4",  # H.264 - MP4 - 256x144
-        }
+    Returns:
+        A tuple containing the lowercase base language and the uppercase country suffix, e.g. ('en', 'US').
+    """
 
-        video_streams = [
-            stream
-            for stream in data
-            if get_value(stream, "vcodec") != "none" and get_value(stream, "format_id", convert_to=int) in format_id_extension_map
-        ]
+    base_system_language, _, system_language_suffix = (getlocale()[0] or "").partition("_")
 
-        def calculate_score(stream: Dict[Any, Any]) -> float:
-            """
-            Calculate a score for a given video stream.
+    if base_system_language and system_language_suffix:
+        return base_system_language.lower(), system_language_suffix.upper()
 
-            - The score is a product of the stream's width, height, framerate, and bitrate.
-            - The score is used to sort the streams in order of quality.
+    return "en", "US"
 
-            Args:
-                stream: The video stream to calculate the score for. (required)
 
-            Returns:
-                The calculated score for the stream.
-            """
+_SYSTEM_LANGUAGE = _get_system_language()
 
-            width = get_value(stream, "width", 0, convert_to=int)
-            height = get_value(stream, "height", 0, convert_to=int)
-            framerate = get_value(stream, "fps", 0, convert_to=float)
-            bitrate = get_value(stream, "tbr", 0, convert_to=float)
 
-            return float(width * height * framerate * bitrate)
+def _scrape_video_urls(
+    scrape_function: Callable[..., Iterator[Dict[str, Any]]], max_attempts: int = 3, base_delay: float = 1.0, **kwargs: Any
+) -> List[str]:
+    """
+    Run a scrapetube generator function and collect the video URLs it yields, retrying with exponential backoff on transient network errors.
 
-        sorted_video_streams = sorted(video_streams, key=calculate_score, reverse=True)
+    - At most two scrapes run at the same time across the process, to stay below YouTube's rate limits. The slot is released while waiting to retry, so a failing scrape does not stall the others.
+    - Only connection errors, timeouts and interrupted responses from requests (used by scrapetube) are retried, after a delay of base_delay * 2 ** attempt seconds plus up to one second of jitter. Any other exception (e.g. a parsing error for a non-existent playlist or channel) is raised right away.
 
-        def extract_stream_info(stream: Dict[Any, Any]) -> Dict[str, Optional[Union[str, int, float, bool]]]:
-            """
-            Extract the information of a given video stream.
+    Args:
+        scrape_function: The scrapetube function to run, e.g. scrapetube.get_playlist. (required)
+        max_attempts: The maximum number of attempts before the last exception is raised. (default: 3)
+        base_delay: The delay in seconds before the first retry. (default: 1.0)
+        **kwargs: The keyword arguments to pass to the scrapetube function.
 
-            Args:
-                stream: The video stream to extract the information from. (required)
+    Returns:
+        A list of video URLs, in the order yielded by the scrapetube function.
+    """
 
-            Returns:
-                A dictionary containing the extracted information of the stream.
-            """
+    from requests import exceptions as requests_exceptions
 
-            codec = get_value(stream, "vcodec")
-            codec_parts = codec.split(".", 1) if codec else []
-            quality_note = get_value(stream, "format_note")
-            youtube_format_id = get_value(stream, "format_id", convert_to=int)
-
-            data = {
-                "url": get_value(stream, "url", convert_to=[unquote, strip]),
-                "codec": codec_parts[0] if codec_parts else None,
-                "codecVariant": codec_parts[1] if len(codec_parts) > 1 else None,
-                "rawCodec": codec,
-                "extension": get_value(format_id_extension_map, youtube_format_id, default_to="mp4"),
-                "width": get_value(stream, "width", convert_to=int),
-                "height": get_value(stream, "height", convert_to=int),
-                "framerate": get_value(stream, "fps", convert_to=float),
-                "bitrate": get_value(stream, "tbr", convert_to=float),
-                "qualityNote": quality_note,
-                "isHDR": "hdr" in quality_note.lower() if quality_note else False,
-                "size": get_value(stream, "filesize", convert_to=int),
-                "language": get_value(stream, "language"),
-                "youtubeFormatId": youtube_format_id,
-            }
+    transient_errors = (
+        requests_exceptions.ConnectionError,
+        requests_exceptions.Timeout,
+        requests_exceptions.ChunkedEncodingError,
+    )
 
-            data["quality"] = data["height"]
+    for attempt in range(max_attempts):
+        try:
+            with _SCRAPE_SEMAPHORE:
+                return [
+                    f"https://www.youtube.com/watch?v={video_id}"
+                    for item in scrape_function(**kwargs)
+                    if (video_id := item.get("videoId"))
+                ]
+        except transient_errors:
+            if attempt == max_attempts - 1:
+                raise
 
-            return dict(sorted(data.items()))
+        sleep(base_delay * 2**attempt + random())
 
-        self.best_video_streams = (
-            [extract_stream_info(stream) for stream in sorted_video_streams] if sorted_video_streams else None
-        )
-        self.best_video_stream = self.best_video_streams[0] if self.best_video_streams else None
-        self.best_video_download_url = self.best_video_stream["url"] if self.best_video_stream else None
 
-        self.available_video_qualities = list(
-            dict.fromkeys([f'{stream["quality"]}p' for stream in self.best_video_streams if stream["quality"]])
-        )
+def clear_cache() -> None:
+    """
+    Remove all entries from the shared cache of dislike counts, playlist videos and channel videos.
 
-        if preferred_quality != "all":
-            preferred_quality = preferred_quality.strip().lower()
+    - The shared cache is only used when the STREAMSNAPPER_CACHE environment variable is set to 1.
+    """
 
-            if preferred_quality not in self.available_video_qualities:
-                best_available_quality = max([stream["quality"] for stream in self.best_video_streams])
-                self.best_video_streams = [
-                    stream for stream in self.best_video_streams if stream["quality"] == best_available_quality
-                ]
-            else:
-                self.best_video_streams = [
-                    stream for stream in self.best_video_streams if stream["quality"] == int(preferred_quality.replace("p", ""))
-                ]
+    for cache in (_get_dislike_count_cache(), _get_video_listing_cache()):
+        if cache:
+            cache.clear()
 
-            self.best_video_stream = self.best_video_streams[0] if self.best_video_streams else {}
-            self.best_video_download_url = self.best_video_stream["url"] if self.best_video_stream else None
 
-    def analyze_audio_streams(self, preferred_language: Union[str, Literal["source", "local", "all"]] = "local") -> None:
+class YouTubeExtractor:
+    """
+    A class for extracting data from YouTube URLs and searching for YouTube videos.
+    """
+
+    def identify_platform(self, url: str) -> Optional[Literal["youtube", "youtubeMusic"]]:
         """
-        Analyze the audio streams of the YouTube video and select the best stream based on the preferred quality.
+        Identify the platform of a given URL as either YouTube or YouTube Music.
 
         Args:
-            preferred_language: The preferred language for the audio stream. If 'source', use the original audio language. If 'local', use the system language. If 'all', return all available audio streams. (default: 'local')
+            url: The URL to identify the platform from. (required)
+
+        Returns:
+            'youtube' if the URL corresponds to YouTube, 'youtubeMusic' if it corresponds to YouTube Music. Returns None if the platform is not recognized.
         """
 
-        data = self._raw_youtube_streams
+        found_match = _PLATFORM_RE.search(url)
 
-        format_id_extension_map = {
-            338: "webm",  # Opus - (VBR) ~480 KBPS - Quadraphonic (4)
-            380: "mp4",  # AC3 - 384 KBPS - Surround (5.1)
-            328: "mp4",  # EAC3 - 384 KBPS - Surround (5.1)
-            325: "mp4",  # DTSE (DTS Express) - 384 KBPS - Surround (5.1)
-            258: "mp4",  # AAC (LC) - 384 KBPS - Surround (5.1)
-            327: "mp4",  # AAC (LC) - 256 KBPS - Surround (5.1)
-            141: "mp4",  # AAC (LC) - 256 KBPS - Stereo (2)
-            774: "webm",  # Opus - (VBR) ~256 KBPS - Stereo (2)
-            256: "mp4",  # AAC (HE v1) - 192 KBPS - Surround (5.1)
-            251: "webm",  # Opus - (VBR) <=160 KBPS - Stereo (2)
-            140: "mp4",  # AAC (LC) - 128 KBPS - Stereo (2)
-            250: "webm",  # Opus - (VBR) ~70 KBPS - Stereo (2)
-            249: "webm",  # Opus - (VBR) ~50 KBPS - Stereo (2)
-            139: "mp4",  # AAC (HE v1) - 48 KBPS - Stereo (2)
-            600: "webm",  # Opus - (VBR) ~35 KBPS - Stereo (2)
-            599: "mp4",  # AAC (HE v1) - 30 KBPS - Stereo (2)
-        }
+        if found_match:
+            return "youtubeMusic" if found_match.group(1) else "youtube"
 
-        audio_streams = [
-            stream
-            for stream in data
-            if get_value(stream, "acodec") != "none" and get_value(stream, "format_id", convert_to=int) in format_id_extension_map
-        ]
+    def extract_video_id(self, url: str) -> Optional[str]:
+        """
+        Extract the YouTube video ID from a URL.
 
-        def calculate_score(stream: Dict[Any, Any]) -> float:
-            """
-            Calculate a score for a given audio stream.
+        - If the URL is already a bare 11-character video ID, it will be returned as is.
+        - Common URL forms are handled with plain substring lookups, falling back to a regular expression for the rest.
 
-            - The score is a product of the stream's bitrate and sample rate.
-            - The score is used to sort the streams in order of quality.
+        Args:
+            url: The URL to extract the video ID from. (required)
 
-            Args:
-                stream: The audio stream to calculate the score for. (required)
+        Returns:
+            The extracted video ID. If no video ID is found, return None.
+        """
 
-            Returns:
-                The calculated score for the stream.
-            """
+        if len(url) == 11 and _VIDEO_ID_CHARACTERS.issuperset(url):
+            return url
 
-            bitrate = get_value(stream, "abr", 0, convert_to=float)
-            sample_rate = get_value(stream, "asr", 0, convert_to=float)
+        # Every regular expression match starts with "youtu", so a common URL form found at its first occurrence is the earliest match
+        prefix_index = url.find("youtu")
 
-            bitrate_priority = 0.1  # The lower the value, the higher the priority of bitrate over samplerate
+        if prefix_index != -1:
+            for prefix in _VIDEO_ID_URL_PREFIXES:
+                if url.startswith(prefix, prefix_index):
+                    video_id = url[prefix_index + len(prefix) : prefix_index + len(prefix) + 11]
 
-            return float((bitrate * bitrate_priority) + (sample_rate / 1000))
+                    if len(video_id) == 11 and _VIDEO_ID_CHARACTERS.issuperset(video_id):
+                        return video_id
 
-        sorted_audio_streams = sorted(audio_streams, key=calculate_score, reverse=True)
+                    break
 
-        def extract_stream_info(stream: Dict[Any, Any]) -> Dict[str, Optional[Union[str, int, float, bool]]]:
-            """
-            Extract the information of a given audio stream.
+        found_match = _VIDEO_ID_RE.search(url)
 
-            Args:
-                stream: The audio stream to extract the information from. (required)
+        return found_match.group(1) if found_match else None
 
-            Returns:
-                A dictionary containing the extracted information of the stream.
-            """
+    def extract_playlist_id(self, url: str, include_private: bool = False) -> Optional[str]:
+        """
+        Extract the YouTube playlist ID from a URL.
 
-            codec = get_value(stream, "acodec")
-            codec_parts = codec.split(".", 1) if codec else []
-            youtube_format_id = get_value(stream, "format_id", convert_to=int)
-            youtube_format_note = get_value(stream, "format_note")
-
-            data = {
-                "url": get_value(stream, "url", convert_to=[unquote, strip]),
-                "codec": codec_parts[0] if codec_parts else None,
-                "codecVariant": codec_parts[1] if len(codec_parts) > 1 else None,
-                "rawCodec": codec,
-                "extension": get_value(format_id_extension_map, youtube_format_id, "mp3"),
-                "bitrate": get_value(stream, "abr", convert_to=float),
-                "qualityNote": youtube_format_note,
-                "isOriginalAudio": "(default)" in youtube_format_note or youtube_format_note.islower()
-                if youtube_format_note
-                else None,
-                "size": get_value(stream, "filesize", convert_to=int),
-                "samplerate": get_value(stream, "asr", convert_to=int),
-                "channels": get_value(stream, "audio_channels", convert_to=int),
-                "language": get_value(stream, "language"),
-                "youtubeFormatId": youtube_format_id,
-            }
+        Args:
+            url: The URL to extract the playlist ID from. (required)
+            include_private: Whether to include private playlists, like the mixes YouTube makes for you. (default: False)
 
-            return dict(sorted(data.items()))
+        Returns:
+            The extracted playlist ID. If no playlist ID is found or the playlist is private and include_private is False, return None.
+        """
 
-        self.best_audio_streams = (
-            [extract_stream_info(stream) for stream in sorted_audio_streams] if sorted_audio_streams else None
-        )
-        self.best_audio_stream = self.best_audio_streams[0] if self.best_audio_streams else None
-        self.best_audio_download_url = self.best_audio_stream["url"] if self.best_audio_stream else None
+        found_match = _PLAYLIST_ID_RE.search(url)
 
-        self.available_audio_languages = list(
-            dict.fromkeys([stream["language"].lower() for stream in self.best_audio_streams if stream["language"]])
-        )
+        if found_match:
+            playlist_id = found_match.group(1)
 
-        if preferred_language != "all":
-            preferred_language = preferred_language.strip().lower()
+            if not include_private:
+                return playlist_id if len(playlist_id) == 34 else None
 
-            if preferred_language == "local":
-                if self.base_system_language in self.available_audio_languages:
-                    self.best_audio_streams = [
-                        stream for stream in self.best_audio_streams if stream["language"] == self.base_system_language
-                    ]
+            return playlist_id if len(playlist_id) >= 34 or playlist_id.startswith("RD") else None
+
+        return None
+
+    def get_dislike_counts(self, video_ids: List[str], max_workers: int = 16) -> Dict[str, Optional[int]]:
+        """
+        Get the dislike counts of multiple YouTube videos from the Return YouTube Dislike API, fetching them concurrently.
+
+        - Requests are sent through the shared pooled HTTP client, with at most max_workers requests in flight at the same time.
+        - If the shared cache is enabled, cached counts are returned without any request.
+        - A request that fails with an HTTP error (e.g. a timeout) only maps its own video ID to None, without affecting the other results.
+
+        Args:
+            video_ids: The IDs of the YouTube videos. (required)
+            max_workers: The maximum number of concurrent requests. (default: 16)
+
+        Returns:
+            A dictionary mapping each video ID to its dislike count, or None if it could not be retrieved.
+        """
+
+        unique_video_ids = list(dict.fromkeys(video_ids))
+
+        if not unique_video_ids:
+            return {}
+
+        from httpx import HTTPError
+
+        _get_http_client()
+
+        def fetch_dislike_count(video_id: str) -> Optional[int]:
+            """
+            Fetch the dislike count of a YouTube video, returning None on HTTP errors.
+
+            Args:
+                video_id: The ID of the YouTube video. (required)
+
+            Returns:
+                The dislike count of the video, or None if it could not be retrieved.
+            """
+
+            try:
+                return _fetch_dislike_count(video_id)
+            except HTTPError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_video_ids))) as executor:
+            return dict(zip(unique_video_ids, executor.map(fetch_dislike_count, unique_video_ids)))
+
+    def search(
+        self,
+        query: str,
+        sort_by: Literal["relevance", "upload_date", "view_count", "rating"] = "relevance",
+        results_type: Literal["video", "channel", "playlist", "movie"] = "video",
+        limit: int = 1,
+    ) -> Optional[List[str]]:
+        """
+        Search for YouTube content based on a query and return a list of URLs (raw data provided by scrapetube library).
+
+        Args:
+            query: The search query string. (required)
+            sort_by: The sorting method to use for the search results. Options are 'relevance', 'upload_date', 'view_count', and 'rating'. (default: 'relevance')
+            results_type: The type of content to search for. Options are 'video', 'channel', 'playlist', and 'movie'. (default: 'video')
+            limit: The maximum number of video URLs to return. (default: 1)
+
+        Returns:
+            A list of video URLs from the search results. If no videos are found, returns None.
+        """
+
+        from scrapetube import get_search as scrape_youtube_search
+
+        try:
+            found_urls = _scrape_video_urls(
+                scrape_youtube_search, query=query, sleep=1, sort_by=sort_by, results_type=results_type, limit=limit
+            )
+        except Exception:
+            return None
+
+        return found_urls if found_urls else None
+
+    def get_playlist_videos(self, url: str, limit: Optional[int] = None) -> Optional[List[str]]:
+        """
+        Get the video URLs from a YouTube playlist (raw data provided by scrapetube library).
+
+        Args:
+            url: The URL of the YouTube playlist. (required)
+            limit: The maximum number of video URLs to return. If None, return all video URLs. (default: None)
+
+        Returns:
+            A list of video URLs from the playlist. If no videos are found or the playlist is private, return None.
+        """
+
+        playlist_id = self.extract_playlist_id(url, include_private=False)
+
+        if not playlist_id:
+            return None
+
+        cache_key = f"playlist:{playlist_id}:{limit}"
+
+        video_listing_cache = _get_video_listing_cache()
+
+        if video_listing_cache:
+            cached_urls = video_listing_cache.get(cache_key)
+
+            if cached_urls:
+                return cached_urls
+
+        from scrapetube import get_playlist as scrape_youtube_playlist
+
+        try:
+            found_urls = _scrape_video_urls(scrape_youtube_playlist, playlist_id=playlist_id, sleep=1, limit=limit)
+        except Exception:
+            return None
+
+        if found_urls and video_listing_cache:
+            video_listing_cache.set(cache_key, found_urls)
+
+        return found_urls if found_urls else None
+
+    def get_channel_videos(
+        self,
+        channel_id: Optional[str] = None,
+        channel_url: Optional[str] = None,
+        channel_username: Optional[str] = None,
+        sort_by: Literal["newest", "oldest", "popular"] = "newest",
+        content_type: Literal["videos", "shorts", "streams"] = "videos",
+        limit: Optional[int] = None,
+    ) -> Optional[List[str]]:
+        """
+        Get the video URLs from a YouTube channel (raw data provided by scrapetube library).
+
+        - If channel_id, channel_url, and channel_username are all None, return None.
+        - If more than one of channel_id, channel_url, and channel_username is provided, raise ValueError.
+
+        Args:
+            channel_id: The ID of the YouTube channel. (default: None)
+            channel_url: The URL of the YouTube channel. (default: None)
+            channel_username: The username of the YouTube channel. (default: None)
+            sort_by: The sorting method to use for the channel videos. Options are 'newest', 'oldest', and 'popular' (default: 'newest').
+            content_type: The type of content to search for. Options are 'videos', 'shorts', and 'streams' (default: 'videos').
+            limit: The maximum number of video URLs to return. If None, return all video URLs. (default: None)
+
+        Returns:
+            A list of video URLs from the channel. If no videos are found or the channel is non-existent, return None.
+        """
+
+        if bool(channel_id) + bool(channel_url) + bool(channel_username) != 1:
+            raise ValueError('Provide only one of the following arguments: "channel_id", "channel_url" or "channel_username"')
+
+        cache_key = f"channel:{channel_id}:{channel_url}:{channel_username}:{sort_by}:{content_type}:{limit}"
+
+        video_listing_cache = _get_video_listing_cache()
+
+        if video_listing_cache:
+            cached_urls = video_listing_cache.get(cache_key)
+
+            if cached_urls:
+                return cached_urls
+
+        from scrapetube import get_channel as scrape_youtube_channel
+
+        try:
+            found_urls = _scrape_video_urls(
+                scrape_youtube_channel,
+                channel_id=channel_id,
+                channel_url=channel_url,
+                channel_username=channel_username.replace("@", "") if channel_username else None,
+                sleep=1,
+                sort_by=sort_by,
+                content_type=content_type,
+                limit=limit,
+            )
+        except Exception:
+            return None
+
+        if found_urls and video_listing_cache:
+            video_listing_cache.set(cache_key, found_urls)
+
+        return found_urls if found_urls else None
+
+
+class YouTube:
+    """
+    A class for extracting and formatting data from YouTube videos, facilitating access to general video information, video streams, audio streams and subtitles.
+    """
+
+    _extractor: ClassVar[YouTubeExtractor] = YouTubeExtractor()
+
+    def __init__(
+        self, logging: bool = False, cache_dir: Optional[Union[str, PathLike]] = None, cache_expire: Optional[int] = 3600
+    ) -> None:
+        """
+        Initialize the YouTube class with the required settings for extracting and formatting data from YouTube videos (raw data provided by yt-dlp library).
+
+        Args:
+            logging: Enable or disable logging for the YouTube class. Defaults to False. (default: False)
+            cache_dir: The directory to cache the extracted yt-dlp data in, keyed by video ID. If None, caching is disabled. (default: None)
+            cache_expire: The time in seconds after which a cached entry is discarded. Keep it below the lifetime of the stream URLs (about 6 hours). If None, entries never expire. (default: 3600)
+        """
+
+        logging = not logging
+
+        self._ydl_opts: Dict[str, bool] = {
+            "extract_flat": True,
+            "geo_bypass": True,
+            "noplaylist": True,
+            "age_limit": None,
+            "quiet": logging,
+            "no_warnings": logging,
+            "ignoreerrors": logging,
+        }
+        self._ydl: Optional["YoutubeDL"] = None
+        self._cache: Optional[Cache] = Cache(cache_dir, expire=cache_expire) if cache_dir is not None else None
+        self._raw_youtube_data: Dict[Any, Any] = {}
+        self._raw_youtube_streams: List[Dict[Any, Any]] = []
+        self._raw_youtube_subtitles: Dict[str, List[Dict[str, str]]] = {}
+
+        self.base_system_language, self.system_language_suffix = _SYSTEM_LANGUAGE
+
+        self.information: Type[InformationStructure] = InformationStructure()
+
+        self.best_video_streams: List[Dict[str, Any]] = []
+        self.best_video_stream: Dict[str, Any] = {}
+        self.best_video_download_url: Optional[str] = None
+
+        self.best_audio_streams: List[Dict[str, Any]] = []
+        self.best_audio_stream: Dict[str, Any] = {}
+        self.best_audio_download_url: Optional[str] = None
+
+        self.subtitle_streams: Dict[str, List[Dict[str, str]]] = {}
+
+        self.available_video_qualities: List[str] = []
+        self.available_audio_languages: List[str] = []
+
+    def extract(self, url: Optional[str] = None, ytdlp_data: Optional[Dict[Any, Any]] = None) -> None:
+        """
+        Extract the YouTube video data from a URL or provided previously extracted yt-dlp data.
+
+        - If a URL is provided, it will be used to scrape the YouTube video data.
+        - If yt-dlp data is provided, it will be used directly.
+        - If both URL and yt-dlp data are provided, the yt-dlp data will be used.
+        - If a cache directory was set, the yt-dlp data will be read from and written to the cache, keyed by video ID.
+
+        Args:
+            url: The YouTube video URL to extract data from. (default: None)
+            ytdlp_data: The previously extracted yt-dlp data. (default: None)
+
+        Raises:
+            ValueError: If no URL or yt-dlp data is provided.
+            InvalidDataError: If the provided yt-dlp data is invalid.
+            ScrapingError: If an error occurs while scraping the YouTube video.
+        """
+
+        self._source_url = url
+
+        if ytdlp_data:
+            self._raw_youtube_data = ytdlp_data
+        elif not url:
+            raise ValueError("No YouTube video URL or yt-dlp data provided")
+        else:
+            self._raw_youtube_data = self._scrape_youtube_data(url, self._get_ydl)
+
+        self._raw_youtube_streams = get_value(self._raw_youtube_data, "formats", convert_to=list)
+        self._raw_youtube_subtitles = get_value(self._raw_youtube_data, "subtitles", convert_to=dict, default_to={})
+
+        if self._raw_youtube_streams is None:
+            raise InvalidDataError('Invalid yt-dlp data. Missing required keys: "formats"')
+
+    def extract_batch(self, urls: List[str], max_workers: int = 8) -> List[Dict[Any, Any]]:
+        """
+        Extract the yt-dlp data of multiple YouTube videos concurrently, without analyzing them.
+
+        - Each worker thread uses its own yt-dlp instance, as yt-dlp instances are not thread-safe. They are closed once the batch is done.
+        - If a cache directory was set, the yt-dlp data will be read from and written to the cache, like in .extract().
+        - URLs pointing to the same video (including different URL forms of it) are extracted only once, and share the same data object in the returned list.
+        - The returned data can be passed to .extract(ytdlp_data=...) to analyze each video.
+
+        Args:
+            urls: The YouTube video URLs to extract data from. (required)
+            max_workers: The maximum number of videos to extract at the same time. (default: 8)
+
+        Returns:
+            A list containing the yt-dlp data of each video, in the same order as the provided URLs.
+
+        Raises:
+            ValueError: If any of the URLs is not a valid YouTube video URL.
+            ScrapingError: If an error occurs while scraping any of the YouTube videos.
+        """
+
+        if not urls:
+            return []
+
+        video_ids = []
+        unique_urls: Dict[str, str] = {}
+
+        for url in urls:
+            video_id = self._extractor.extract_video_id(url)
+
+            if not video_id:
+                raise ValueError(f'Invalid YouTube video URL: "{url}"')
+
+            video_ids.append(video_id)
+            unique_urls.setdefault(video_id, url)
+
+        from yt_dlp import YoutubeDL
+
+        thread_data = local()
+        created_ydls: List["YoutubeDL"] = []
+
+        def get_thread_ydl() -> "YoutubeDL":
+            """
+            Get the yt-dlp instance of the current worker thread, creating it on first use.
+
+            Returns:
+                The yt-dlp instance of the current worker thread.
+            """
+
+            ydl = getattr(thread_data, "ydl", None)
+
+            if ydl is None:
+                ydl = thread_data.ydl = YoutubeDL(self._ydl_opts)
+                created_ydls.append(ydl)
+
+            return ydl
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+                extracted_data = dict(
+                    zip(
+                        unique_urls,
+                        executor.map(lambda url: self._scrape_youtube_data(url, get_thread_ydl), unique_urls.values()),
+                    )
+                )
+        finally:
+            for ydl in created_ydls:
+                ydl.close()
+
+        return [extracted_data[video_id] for video_id in video_ids]
+
+    def _get_ydl(self) -> "YoutubeDL":
+        """
+        Get the yt-dlp instance reused across .extract() calls, creating it on first use.
+
+        Returns:
+            The yt-dlp instance of this object.
+        """
+
+        if self._ydl is None:
+            from yt_dlp import YoutubeDL
+
+            self._ydl = YoutubeDL(self._ydl_opts)
+
+        return self._ydl
+
+    def _scrape_youtube_data(self, url: str, get_ydl: Callable[[], "YoutubeDL"]) -> Dict[Any, Any]:
+        """
+        Scrape the yt-dlp data of a YouTube video, reading from and writing to the cache if a cache directory was set.
+
+        Args:
+            url: The YouTube video URL to scrape. (required)
+            get_ydl: A function returning the yt-dlp instance to use. It is only called if the data is not cached. (required)
+
+        Returns:
+            The yt-dlp data of the video.
+
+        Raises:
+            ValueError: If the URL is not a valid YouTube video URL.
+            ScrapingError: If an error occurs while scraping the YouTube video.
+        """
+
+        video_id = self._extractor.extract_video_id(url)
+
+        if not video_id:
+            raise ValueError(f'Invalid YouTube video URL: "{url}"')
+
+        cached_data = self._cache.get(video_id) if self._cache else None
+
+        if cached_data:
+            return cached_data
+
+        from yt_dlp import YoutubeDL
+        from yt_dlp import utils as yt_dlp_utils
+
+        try:
+            data = get_ydl().extract_info(url=url, download=False, process=True)
+        except (yt_dlp_utils.DownloadError, yt_dlp_utils.ExtractorError) as e:
+            raise ScrapingError(f'Error occurred while scraping YouTube video: "{url}"') from e
+        except Exception as e:
+            raise ScrapingError(f'Unexpected error occurred while scraping YouTube video: "{url}"') from e
+
+        if not data:
+            raise ScrapingError(f'No data was returned while scraping YouTube video: "{url}"')
+
+        if self._cache:
+            self._cache.set(video_id, YoutubeDL.sanitize_info(data))
+
+        return data
+
+    def close(self) -> None:
+        """
+        Close the yt-dlp instance reused across .extract() calls, releasing its open connections.
+        """
+
+        if self._ydl is not None:
+            self._ydl.close()
+            self._ydl = None
+
+    def analyze_information(self, check_thumbnails: bool = False, retrieve_dislike_count: bool = False) -> None:
+        """
+        Analyze the information of the YouTube video.
+
+        Args:
+            check_thumbnails: Check if all video thumbnails are available. (default: False)
+            retrieve_dislike_count: Retrieve the dislike count from the returnyoutubedislike.com API. (default: False)
+
+        Raises:
+            InvalidDataError: If the provided yt-dlp data is invalid.
+        """
+
+        data = self._raw_youtube_data
+
+        id_ = data.get("id")
+        title = get_value(data, "fulltitle", ["title"])
+        clean_title = format_string(title)
+        description = data.get("description")
+        channel_name = get_value(data, "channel", ["uploader"])
+        clean_channel_name = format_string(channel_name)
+        chapters = [
+            {
+                "title": chapter.get("title"),
+                "startTime": get_value(chapter, "start_time", convert_to=float),
+                "endTime": get_value(chapter, "end_time", convert_to=float),
+            }
+            for chapter in data.get("chapters") or []
+        ]
+
+        thumbnails = [f"https://img.youtube.com/vi/{id_}/{name}.jpg" for name in _THUMBNAIL_NAMES]
+        dislike_count = None
+
+        if check_thumbnails or retrieve_dislike_count:
+            http_client = _get_http_client()
+
+            with ThreadPoolExecutor(max_workers=_THUMBNAIL_PROBE_BATCH_SIZE + 1) as executor:
+                dislike_count_future = executor.submit(_fetch_dislike_count, id_) if retrieve_dislike_count else None
+
+                if check_thumbnails:
+                    first_valid_index = len(thumbnails)
+
+                    for batch_start in range(0, len(thumbnails), _THUMBNAIL_PROBE_BATCH_SIZE):
+                        probe_results = executor.map(
+                            lambda thumbnail: http_client.head(thumbnail, follow_redirects=False).is_success,
+                            thumbnails[batch_start : batch_start + _THUMBNAIL_PROBE_BATCH_SIZE],
+                        )
+                        valid_index = next((index for index, is_valid in enumerate(probe_results) if is_valid), None)
+
+                        if valid_index is not None:
+                            first_valid_index = batch_start + valid_index
+                            break
+
+                    thumbnails = thumbnails[first_valid_index:]
+
+                if dislike_count_future:
+                    dislike_count = dislike_count_future.result()
+
+        information = InformationStructure()
+
+        information._sourceUrl = self._source_url
+        information._shortUrl = f"https://youtu.be/{id_}"
+        information._embedUrl = f"https://www.youtube.com/embed/{id_}"
+        information._youtubeMusicUrl = f"https://music.youtube.com/watch?v={id_}"
+        information._fullUrl = f"https://www.youtube.com/watch?v={id_}"
+        information._id = id_
+        information._title = title
+        information._cleanTitle = clean_title
+        information._description = description if description else None
+        information._channelId = data.get("channel_id")
+        information._channelUrl = get_value(data, "channel_url", ["uploader_url"])
+        information._channelName = channel_name
+        information._cleanChannelName = clean_channel_name
+        information._isVerifiedChannel = data.get("channel_is_verified") or False
+        information._duration = data.get("duration")
+        information._viewCount = data.get("view_count")
+        information._isAgeRestricted = get_value(data, "age_limit", convert_to=bool)
+        information._categories = data.get("categories") or []
+        information._tags = data.get("tags") or []
+        information._isStreaming = data.get("is_live")
+        information._uploadTimestamp = get_value(data, "timestamp", ["release_timestamp"])
+        information._availability = data.get("availability")
+        information._chapters = chapters
+        information._commentCount = get_value(data, "comment_count", convert_to=int, default_to=0)
+        information._likeCount = get_value(data, "like_count", convert_to=int)
+        information._dislikeCount = dislike_count
+        information._followCount = get_value(data, "channel_follower_count", convert_to=int)
+        information._language = data.get("language")
+        information._thumbnails = thumbnails
+
+        self.information = information
+
+    def analyze_video_streams(
+        self,
+        preferred_quality: Literal["144p", "240p", "360p", "480p", "720p", "1080p", "1440p", "2160p", "4320p", "all"] = "all",
+    ) -> None:
+        """
+        Analyze the video streams of the YouTube video and select the best stream based on the preferred quality.
+
+        Args:
+            preferred_quality: The preferred quality of the video stream. If a specific quality is provided, the stream will be selected according to the chosen quality, however if the quality is not available, the best quality will be selected. If 'all', all streams will be considered and sorted by quality. (default: 'all')
+        """
+
+        data = self._raw_youtube_streams
+
+        scored_video_streams = []
+        scored_video_streams_by_height: Dict[Optional[int], List[Tuple[float, int, Dict[Any, Any]]]] = {}
+
+        for stream in data:
+            if stream.get("vcodec") == "none":
+                continue
+
+            youtube_format_id = _parse_format_id(stream)
+
+            if youtube_format_id not in _VIDEO_FORMAT_IDS:
+                continue
+
+            scored_stream = (_score_video_stream(stream), youtube_format_id, stream)
+            scored_video_streams.append(scored_stream)
+            scored_video_streams_by_height.setdefault(stream.get("height"), []).append(scored_stream)
+
+        available_heights = [height for height in scored_video_streams_by_height if height]
+        self.available_video_qualities = [f"{height}p" for height in sorted(available_heights, reverse=True)]
+
+        if preferred_quality != "all":
+            preferred_quality = preferred_quality.strip().lower()
+
+            if preferred_quality not in self.available_video_qualities:
+                target_height = max(available_heights, default=0)
+            else:
+                target_height = int(preferred_quality[:-1])
+
+            scored_video_streams = scored_video_streams_by_height.get(target_height, [])
+
+        scored_video_streams.sort(key=itemgetter(0), reverse=True)
+
+        self.best_video_streams = (
+            [_extract_video_stream_info(stream, youtube_format_id) for _, youtube_format_id, stream in scored_video_streams]
+            if scored_video_streams
+            else None
+        )
+        self.best_video_stream = self.best_video_streams[0] if self.best_video_streams else None
+        self.best_video_download_url = self.best_video_stream["url"] if self.best_video_stream else None
+
+    def analyze_audio_streams(self, preferred_language: Union[str, Literal["source", "local", "all"]] = "local") -> None:
+        """
+        Analyze the audio streams of the YouTube video and select the best stream based on the preferred quality.
+
+        Args:
+            preferred_language: The preferred language for the audio stream. If 'source', use the original audio language. If 'local', use the system language. If 'all', return all available audio streams. (default: 'local')
+        """
+
+        data = self._raw_youtube_streams
+
+        scored_audio_streams = [
+            (_score_audio_stream(stream), youtube_format_id, stream)
+            for stream in data
+            if stream.get("acodec") != "none" and (youtube_format_id := _parse_format_id(stream)) in _AUDIO_FORMAT_IDS
+        ]
+        scored_audio_streams.sort(key=itemgetter(0), reverse=True)
+
+        self.best_audio_streams = (
+            [_extract_audio_stream_info(stream, youtube_format_id) for _, youtube_format_id, stream in scored_audio_streams]
+            if scored_audio_streams
+            else None
+        )
+        self.best_audio_stream = self.best_audio_streams[0] if self.best_audio_streams else None
+        self.best_audio_download_url = self.best_audio_stream["url"] if self.best_audio_stream else None
+
+        if not self.best_audio_streams:
+            self.available_audio_languages = []
+
+            return
+
+        self.available_audio_languages = list(
+            dict.fromkeys([stream["language"].lower() for stream in self.best_audio_streams if stream["language"]])
+        )
+
+        if preferred_language != "all":
+            preferred_language = preferred_language.strip().lower()
+
+            if preferred_language == "local":
+                if self.base_system_language in self.available_audio_languages:
+                    self.best_audio_streams = [
+                        stream for stream in self.best_audio_streams if stream["language"] == self.base_system_language
+                    ]
                 else:
                     preferred_language = "source"
             if preferred_language == "source":
@@ -892,17 +1545,17 @@ class YouTube:
 
         subtitle_streams = {}
 
-        for stream in data:
+        for stream, subtitles in sorted(data.items()):
             subtitle_streams[stream] = [
                 {
-                    "extension": get_value(subtitle, "ext"),
-                    "url": get_value(subtitle, "url", convert_to=[unquote, strip]),
-                    "language": get_value(subtitle, "name"),
+                    "extension": subtitle.get("ext"),
+                    "url": unquote_url(subtitle.get("url")),
+                    "language": subtitle.get("name"),
                 }
-                for subtitle in data[stream]
+                for subtitle in subtitles
             ]
 
-        self.subtitle_streams = dict(sorted(subtitle_streams.items()))
+        self.subtitle_streams = subtitle_streams
 
     def download(
         self,
@@ -951,7 +1604,7 @@ class YouTube:
         if not self._raw_youtube_data:
             raise EmptyDataError("No YouTube data available. Please call .extract() first.")
 
-        if not self.information:
+        if self.information.id is None:
             self.analyze_information(check_thumbnails=False, retrieve_dislike_count=False)
 
         if not video_stream and not audio_stream:
@@ -961,38 +1614,32 @@ class YouTube:
             video_stream = self.best_video_stream
             audio_stream = self.best_audio_stream
 
+        from turbodl import TurboDL
+
         output_path = Path(output_path)
+        output_name = f"{self.information.cleanTitle} [{self.information.id}]"
+        downloader = TurboDL(
+            max_connections=max_connections,
+            connection_speed=connection_speed,
+            overwrite=overwrite,
+            show_progress_bars=show_progress_bar,
+            timeout=timeout,
+        )
 
         if video_stream and audio_stream:
             if output_path.is_dir():
-                output_path = Path(
-                    output_path, f'{self.information["cleanTitle"]} [{self.information["id"]}].{video_stream["extension"]}'
-                )
+                output_path = Path(output_path, f'{output_name}.{video_stream["extension"]}')
 
             tmp_path = Path(gettempdir(), ".tmp-streamsnapper-downloader")
             tmp_path.mkdir(exist_ok=True)
 
-            output_video_path = Path(tmp_path, f'.tmp-video-{self.information["id"]}.{video_stream["extension"]}')
-            video_downloader = TurboDL(
-                max_connections=max_connections,
-                connection_speed=connection_speed,
-                overwrite=overwrite,
-                show_progress_bars=show_progress_bar,
-                timeout=timeout,
-            )
-            video_downloader.download(
+            output_video_path = Path(tmp_path, f'.tmp-video-{self.information.id}.{video_stream["extension"]}')
+            downloader.download(
                 video_stream["url"], output_video_path, pre_allocate_space=pre_allocate_space, use_ram_buffer=use_ram_buffer
             )
 
-            output_audio_path = Path(tmp_path, f'.tmp-audio-{self.information["id"]}.{audio_stream["extension"]}')
-            audio_downloader = TurboDL(
-                max_connections=max_connections,
-                connection_speed=connection_speed,
-                overwrite=overwrite,
-                show_progress_bars=show_progress_bar,
-                timeout=timeout,
-            )
-            audio_downloader.download(
+            output_audio_path = Path(tmp_path, f'.tmp-audio-{self.information.id}.{audio_stream["extension"]}')
+            downloader.download(
                 audio_stream["url"], output_audio_path, pre_allocate_space=pre_allocate_space, use_ram_buffer=use_ram_buffer
             )
 
@@ -1006,17 +1653,8 @@ class YouTube:
             return output_path.resolve()
         elif video_stream:
             if output_path.is_dir():
-                output_path = Path(
-                    output_path, f'{self.information["cleanTitle"]} [{self.information["id"]}].{video_stream["extension"]}'
-                )
+                output_path = Path(output_path, f'{output_name}.{video_stream["extension"]}')
 
-            downloader = TurboDL(
-                max_connections=max_connections,
-                connection_speed=connection_speed,
-                overwrite=overwrite,
-                show_progress_bars=show_progress_bar,
-                timeout=timeout,
-            )
             downloader.download(
                 video_stream["url"], output_path, pre_allocate_space=pre_allocate_space, use_ram_buffer=use_ram_buffer
             )
@@ -1024,208 +1662,10 @@ class YouTube:
             return Path(downloader.output_path)
         elif audio_stream:
             if output_path.is_dir():
-                output_path = Path(
-                    output_path, f'{self.information["cleanTitle"]} [{self.information["id"]}].{audio_stream["extension"]}'
-                )
+                output_path = Path(output_path, f'{output_name}.{audio_stream["extension"]}')
 
-            downloader = TurboDL(
-                max_connections=max_connections,
-                connection_speed=connection_speed,
-                overwrite=overwrite,
-                show_progress_bars=show_progress_bar,
-                timeout=timeout,
-            )
             downloader.download(
                 audio_stream["url"], output_path, pre_allocate_space=pre_allocate_space, use_ram_buffer=use_ram_buffer
             )
 
             return Path(downloader.output_path)
-
-
-class YouTubeExtractor:
-    """
-    A class for extracting data from YouTube URLs and searching for YouTube videos.
-    """
-
-    def __init__(self) -> None:
-        """
-        Initialize the Extractor class with some regular expressions for analyzing YouTube URLs.
-        """
-
-        self._platform_regex = re_compile(r"(?:https?://)?(?:www\.)?(music\.)?youtube\.com|youtu\.be|youtube\.com/shorts")
-        self._video_id_regex = re_compile(
-            r"(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/|shorts/|music/|live/|.*[?&]v=))([a-zA-Z0-9_-]{11})"
-        )
-        self._playlist_id_regex = re_compile(
-            r"(?:youtube\.com/(?:playlist\?list=|watch\?.*?&list=|music/playlist\?list=|music\.youtube\.com/watch\?.*?&list=))([a-zA-Z0-9_-]+)"
-        )
-
-    def identify_platform(self, url: str) -> Optional[Literal["youtube", "youtubeMusic"]]:
-        """
-        Identify the platform of a given URL as either YouTube or YouTube Music.
-
-        Args:
-            url: The URL to identify the platform from. (required)
-
-        Returns:
-            'youtube' if the URL corresponds to YouTube, 'youtubeMusic' if it corresponds to YouTube Music. Returns None if the platform is not recognized.
-        """
-
-        found_match = self._platform_regex.search(url)
-
-        if found_match:
-            return "youtubeMusic" if found_match.group(1) else "youtube"
-
-    def extract_video_id(self, url: str) -> Optional[str]:
-        """
-        Extract the YouTube video ID from a URL.
-
-        Args:
-            url: The URL to extract the video ID from. (required)
-
-        Returns:
-            The extracted video ID. If no video ID is found, return None.
-        """
-
-        found_match = self._video_id_regex.search(url)
-
-        return found_match.group(1) if found_match else None
-
-    def extract_playlist_id(self, url: str, include_private: bool = False) -> Optional[str]:
-        """
-        Extract the YouTube playlist ID from a URL.
-
-        Args:
-            url: The URL to extract the playlist ID from. (required)
-            include_private: Whether to include private playlists, like the mixes YouTube makes for you. (default: False)
-
-        Returns:
-            The extracted playlist ID. If no playlist ID is found or the playlist is private and include_private is False, return None.
-        """
-
-        found_match = self._playlist_id_regex.search(url)
-
-        if found_match:
-            playlist_id = found_match.group(1)
-
-            if not include_private:
-                return playlist_id if len(playlist_id) == 34 else None
-
-            return playlist_id if len(playlist_id) >= 34 or playlist_id.startswith("RD") else None
-
-        return None
-
-    def search(
-        self,
-        query: str,
-        sort_by: Literal["relevance", "upload_date", "view_count", "rating"] = "relevance",
-        results_type: Literal["video", "channel", "playlist", "movie"] = "video",
-        limit: int = 1,
-    ) -> Optional[List[str]]:
-        """
-        Search for YouTube content based on a query and return a list of URLs (raw data provided by scrapetube library).
-
-        Args:
-            query: The search query string. (required)
-            sort_by: The sorting method to use for the search results. Options are 'relevance', 'upload_date', 'view_count', and 'rating'. (default: 'relevance')
-            results_type: The type of content to search for. Options are 'video', 'channel', 'playlist', and 'movie'. (default: 'video')
-            limit: The maximum number of video URLs to return. (default: 1)
-
-        Returns:
-            A list of video URLs from the search results. If no videos are found, returns None.
-        """
-
-        try:
-            extracted_data = list(
-                scrape_youtube_search(query=query, sleep=1, sort_by=sort_by, results_type=results_type, limit=limit)
-            )
-        except Exception:
-            return None
-
-        if extracted_data:
-            found_urls = [
-                f'https://www.youtube.com/watch?v={item.get("videoId")}' for item in extracted_data if item.get("videoId")
-            ]
-
-            return found_urls if found_urls else None
-
-    def get_playlist_videos(self, url: str, limit: Optional[int] = None) -> Optional[List[str]]:
-        """
-        Get the video URLs from a YouTube playlist (raw data provided by scrapetube library).
-
-        Args:
-            url: The URL of the YouTube playlist. (required)
-            limit: The maximum number of video URLs to return. If None, return all video URLs. (default: None)
-
-        Returns:
-            A list of video URLs from the playlist. If no videos are found or the playlist is private, return None.
-        """
-
-        playlist_id = self.extract_playlist_id(url, include_private=False)
-
-        if not playlist_id:
-            return None
-
-        try:
-            extracted_data = list(scrape_youtube_playlist(playlist_id, sleep=1, limit=limit))
-        except Exception:
-            return None
-
-        if extracted_data:
-            found_urls = [
-                f'https://www.youtube.com/watch?v={item.get("videoId")}' for item in extracted_data if item.get("videoId")
-            ]
-
-            return found_urls if found_urls else None
-
-    def get_channel_videos(
-        self,
-        channel_id: Optional[str] = None,
-        channel_url: Optional[str] = None,
-        channel_username: Optional[str] = None,
-        sort_by: Literal["newest", "oldest", "popular"] = "newest",
-        content_type: Literal["videos", "shorts", "streams"] = "videos",
-        limit: Optional[int] = None,
-    ) -> Optional[List[str]]:
-        """
-        Get the video URLs from a YouTube channel (raw data provided by scrapetube library).
-
-        - If channel_id, channel_url, and channel_username are all None, return None.
-        - If more than one of channel_id, channel_url, and channel_username is provided, raise ValueError.
-
-        Args:
-            channel_id: The ID of the YouTube channel. (default: None)
-            channel_url: The URL of the YouTube channel. (default: None)
-            channel_username: The username of the YouTube channel. (default: None)
-            sort_by: The sorting method to use for the channel videos. Options are 'newest', 'oldest', and 'popular' (default: 'newest').
-            content_type: The type of content to search for. Options are 'videos', 'shorts', and 'streams' (default: 'videos').
-            limit: The maximum number of video URLs to return. If None, return all video URLs. (default: None)
-
-        Returns:
-            A list of video URLs from the channel. If no videos are found or the channel is non-existent, return None.
-        """
-
-        if sum([bool(channel_id), bool(channel_url), bool(channel_username)]) != 1:
-            raise ValueError('Provide only one of the following arguments: "channel_id", "channel_url" or "channel_username"')
-
-        try:
-            extracted_data = list(
-                scrape_youtube_channel(
-                    channel_id=channel_id,
-                    channel_url=channel_url,
-                    channel_username=channel_username.replace("@", ""),
-                    sleep=1,
-                    sort_by=sort_by,
-                    content_type=content_type,
-                    limit=limit,
-                )
-            )
-        except Exception:
-            return None
-
-        if extracted_data:
-            found_urls = [
-                f'https://www.youtube.com/watch?v={item.get("videoId")}' for item in extracted_data if item.get("videoId")
-            ]
-
-            return found_urls if found_urls else None